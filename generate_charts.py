@@ -4,10 +4,14 @@ Reads from historical_data.json and creates chart images
 Brand colors: Slate #2c3e50, Teal #0d9488
 """
 
-import matplotlib.pyplot as plt
+import matplotlib as mpl
 import matplotlib.dates as mdates
+import matplotlib.style as mstyle
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 import json
 import os
+from bisect import bisect_left
 from datetime import datetime, timedelta
 
 # Brand colors
@@ -17,19 +21,31 @@ BG_COLOR = '#ffffff'
 GRID_COLOR = '#e0e0e0'
 
 # Set up matplotlib style
-plt.style.use('default')
-plt.rcParams['figure.facecolor'] = BG_COLOR
-plt.rcParams['axes.facecolor'] = BG_COLOR
-plt.rcParams['axes.edgecolor'] = SLATE
-plt.rcParams['grid.color'] = GRID_COLOR
-plt.rcParams['text.color'] = SLATE
-plt.rcParams['axes.labelcolor'] = SLATE
-plt.rcParams['xtick.color'] = SLATE
-plt.rcParams['ytick.color'] = SLATE
-plt.rcParams['font.family'] = 'sans-serif'
-plt.rcParams['font.weight'] = 'bold'
-plt.rcParams['xtick.labelsize'] = 18
-plt.rcParams['ytick.labelsize'] = 18
+mstyle.use('default')
+mpl.rcParams['figure.facecolor'] = BG_COLOR
+mpl.rcParams['axes.facecolor'] = BG_COLOR
+mpl.rcParams['axes.edgecolor'] = SLATE
+mpl.rcParams['grid.color'] = GRID_COLOR
+mpl.rcParams['text.color'] = SLATE
+mpl.rcParams['axes.labelcolor'] = SLATE
+mpl.rcParams['xtick.color'] = SLATE
+mpl.rcParams['ytick.color'] = SLATE
+mpl.rcParams['font.family'] = 'sans-serif'
+mpl.rcParams['font.weight'] = 'bold'
+mpl.rcParams['xtick.labelsize'] = 18
+mpl.rcParams['ytick.labelsize'] = 18
+
+# Look-back window for each time filter (no filter = complete history)
+TIME_FILTER_DAYS = {'30d': 30, '90d': 90, '6m': 180, '12m': 365}
+
+# X-axis (date formatter, tick locator) for each time filter, built once
+DATE_AXES = {
+    '30d': (mdates.DateFormatter('%b %d'), mdates.WeekdayLocator(interval=1)),
+    '90d': (mdates.DateFormatter('%b %d'), mdates.WeekdayLocator(interval=1)),
+    '6m': (mdates.DateFormatter('%b %Y'), mdates.MonthLocator(interval=2)),
+    '12m': (mdates.DateFormatter('%b %Y'), mdates.MonthLocator(interval=2)),
+    None: (mdates.DateFormatter('%Y'), mdates.YearLocator()),  # All time
+}
 
 
 def load_historical_data():
@@ -37,35 +53,34 @@ def load_historical_data():
     with open('historical_data.json', 'r') as f:
         data = json.load(f)
     
-    dates = [datetime.strptime(d['date'], '%Y-%m-%d') for d in data]
+    dates = [datetime.fromisoformat(d['date']) for d in data]
     values = [d['total'] for d in data]
     return dates, values
 
 
-def create_chart(dates, values, title, filename, time_filter=None):
-    """Create a single trend chart"""
+def reset_axes(ax):
+    """Clear a reused Axes and restore its figure's default margins"""
+    ax.cla()
+    # tight_layout would otherwise start from the previous chart's margins
+    ax.figure.subplots_adjust(**{side: mpl.rcParams[f'figure.subplot.{side}']
+                                 for side in ('left', 'right', 'bottom', 'top')})
+
+
+def create_chart(ax, dates, values, title, filename, time_filter=None):
+    """Create a single trend chart, redrawing onto a reused Axes"""
     
     # Filter data based on time range
-    if time_filter:
-        now = datetime.now()
-        if time_filter == '30d':
-            cutoff = now - timedelta(days=30)
-        elif time_filter == '90d':
-            cutoff = now - timedelta(days=90)
-        elif time_filter == '6m':
-            cutoff = now - timedelta(days=180)
-        elif time_filter == '12m':
-            cutoff = now - timedelta(days=365)
-        else:
-            cutoff = None
-        
-        if cutoff:
-            filtered = [(d, v) for d, v in zip(dates, values) if d >= cutoff]
-            if filtered:
-                dates = [x[0] for x in filtered]
-                values = [x[1] for x in filtered]
-    
-    fig, ax = plt.subplots(figsize=(14, 7))
+    days = TIME_FILTER_DAYS.get(time_filter)
+    if days:
+        cutoff = datetime.now() - timedelta(days=days)
+        # History is stored oldest first, so the window is a tail slice
+        start = bisect_left(dates, cutoff)
+        if start < len(dates):
+            dates = dates[start:]
+            values = values[start:]
+    
+    fig = ax.figure
+    reset_axes(ax)
     
     # Create gradient fill under the line
     ax.fill_between(dates, values, alpha=0.3, color=TEAL)
@@ -77,8 +92,7 @@ def create_chart(dates, values, title, filename, time_filter=None):
     ax.scatter([dates[-1]], [values[-1]], color=TEAL, s=100, zorder=5, edgecolors=SLATE, linewidths=2)
     
     # Mark the peak point
-    max_val = max(values)
-    max_idx = values.index(max_val)
+    max_idx = values.index(max(values))
     if max_idx != len(values) - 1:  # Don't double-mark if current is peak
         ax.scatter([dates[max_idx]], [values[max_idx]], color=TEAL, s=80, zorder=5, edgecolors=SLATE, linewidths=2)
     
@@ -93,17 +107,12 @@ def create_chart(dates, values, title, filename, time_filter=None):
     ax.set_axisbelow(True)
     
     # Format x-axis dates
-    if time_filter in ['30d', '90d']:
-        ax.xaxis.set_major_formatter(mdates.DateFormatter('%b %d'))
-        ax.xaxis.set_major_locator(mdates.WeekdayLocator(interval=1))
-    elif time_filter in ['6m', '12m']:
-        ax.xaxis.set_major_formatter(mdates.DateFormatter('%b %Y'))
-        ax.xaxis.set_major_locator(mdates.MonthLocator(interval=2))
-    else:  # All time
-        ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y'))
-        ax.xaxis.set_major_locator(mdates.YearLocator())
-    
-    plt.xticks(rotation=45, ha='right', fontsize=18)
+    formatter, locator = DATE_AXES.get(time_filter, DATE_AXES[None])
+    ax.xaxis.set_major_formatter(formatter)
+    ax.xaxis.set_major_locator(locator)
+    
+    for label in ax.get_xticklabels():
+        label.set(rotation=45, ha='right', fontsize=18)
     
     # Add legend
     legend_text = 'Fractional\nOpenings'
@@ -112,19 +121,19 @@ def create_chart(dates, values, title, filename, time_filter=None):
                 bbox=dict(boxstyle='round', facecolor=BG_COLOR, edgecolor='none'))
     
     # Tight layout
-    plt.tight_layout()
+    fig.tight_layout()
     
     # Save
-    plt.savefig(filename, dpi=150, facecolor=BG_COLOR, edgecolor='none', 
+    fig.savefig(filename, dpi=150, facecolor=BG_COLOR, edgecolor='none', 
                 bbox_inches='tight', pad_inches=0.2)
-    plt.close()
     print(f"Created: {filename}")
 
 
-def create_highlight_card(value, subtitle, brand_text, filename):
-    """Create a highlight card"""
+def create_highlight_card(ax, value, subtitle, brand_text, filename):
+    """Create a highlight card, redrawing onto a reused Axes"""
     
-    fig, ax = plt.subplots(figsize=(10, 7))
+    fig = ax.figure
+    reset_axes(ax)
     ax.set_facecolor(BG_COLOR)
     fig.patch.set_facecolor(BG_COLOR)
     
@@ -143,10 +152,9 @@ def create_highlight_card(value, subtitle, brand_text, filename):
     ax.text(0.5, 0.15, brand_text, fontsize=22, fontweight='bold', color=TEAL,
             ha='center', va='center', transform=ax.transAxes)
     
-    plt.tight_layout()
-    plt.savefig(filename, dpi=150, facecolor=BG_COLOR, edgecolor='none',
+    fig.tight_layout()
+    fig.savefig(filename, dpi=150, facecolor=BG_COLOR, edgecolor='none',
                 bbox_inches='tight', pad_inches=0.3)
-    plt.close()
     print(f"Created: {filename}")
 
 
@@ -159,29 +167,32 @@ if __name__ == "__main__":
     dates, values = load_historical_data()
     print(f"Loaded {len(dates)} data points")
     
-    # Create all charts
+    # Create all charts on one shared figure
     print("\nCreating charts...")
+    trend_fig = Figure(figsize=(14, 7))
+    FigureCanvasAgg(trend_fig)
+    trend_ax = trend_fig.subplots()
     
-    create_chart(dates, values, 
+    create_chart(trend_ax, dates, values, 
                  'Fractional Executive Market Trends - Complete History',
                  'charts/trend_all_time.png')
     
-    create_chart(dates, values,
+    create_chart(trend_ax, dates, values,
                  'Fractional Executive Trends - Last 12 Months', 
                  'charts/trend_12_months.png',
                  time_filter='12m')
     
-    create_chart(dates, values,
+    create_chart(trend_ax, dates, values,
                  'Fractional Executive Trends - Last 6 Months',
                  'charts/trend_6_months.png', 
                  time_filter='6m')
     
-    create_chart(dates, values,
+    create_chart(trend_ax, dates, values,
                  'Fractional Executive Trends - Last 90 Days',
                  'charts/trend_90_days.png',
                  time_filter='90d')
     
-    create_chart(dates, values,
+    create_chart(trend_ax, dates, values,
                  'Fractional Executive Trends - Last 30 Days',
                  'charts/trend_30_days.png',
                  time_filter='30d')
@@ -189,16 +200,19 @@ if __name__ == "__main__":
     # Create highlight cards with current stats
     current_total = values[-1]
     peak_total = max(values)
+    card_fig = Figure(figsize=(10, 7))
+    FigureCanvasAgg(card_fig)
+    card_ax = card_fig.subplots()
     
-    create_highlight_card(str(current_total), "Fractional Openings\nThis Week",
+    create_highlight_card(card_ax, str(current_total), "Fractional Openings\nThis Week",
                           'The Fractional Report',
                           'charts/highlight_current.png')
     
-    create_highlight_card('$213/hr', "Average Fractional\nHourly Rate",
+    create_highlight_card(card_ax, '$213/hr', "Average Fractional\nHourly Rate",
                           'The Fractional Report',
                           'charts/highlight_rate.png')
     
-    create_highlight_card('120K', "Fractional Executives\nin 2024",
+    create_highlight_card(card_ax, '120K', "Fractional Executives\nin 2024",
                           'The Fractional Report',
                           'charts/highlight_market.png')
     
@@ -8,19 +8,60 @@ Replace your existing scrape_fractional.py with this file.
 from jobspy import scrape_jobs
 import pandas as pd
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
 import time
 import re
+import sys
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
-print("=" * 60)
-print("FRACTIONAL EXECUTIVE JOB SCRAPER (v2 - Improved)")
-print("=" * 60)
-print(f"Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-print("=" * 60)
+
+class RateLimiter:
+    """Space out request start times across threads.
+    
+    The interval doubles after each reported failure (up to max_interval)
+    and halves back toward the base interval after each success.
+    """
+    
+    def __init__(self, interval, max_interval=None):
+        self.min_interval = interval
+        self.max_interval = max(interval, max_interval or interval)
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_time = 0.0
+    
+    def wait(self):
+        """Block until the caller's slot comes up"""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_time)
+            self._next_time = slot + self.interval
+        time.sleep(slot - now)
+    
+    def record_success(self):
+        with self._lock:
+            self.interval = max(self.min_interval, self.interval / 2)
+    
+    def record_failure(self):
+        with self._lock:
+            self.interval = min(self.max_interval, self.interval * 2)
+
+
+logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
+logger = logging.getLogger('scraper')
+
+logger.info("=" * 60)
+logger.info("FRACTIONAL EXECUTIVE JOB SCRAPER (v2 - Improved)")
+logger.info("=" * 60)
+logger.info("Started: %s", datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+logger.info("=" * 60)
 
 # ============================================================
-# PART 1: INDEED (via JobSpy) - Unchanged
+# PART 1: INDEED (via JobSpy)
 # ============================================================
 
 SEARCH_TERMS = [
@@ -34,17 +75,20 @@ SEARCH_TERMS = [
 
 LOCATIONS = ["United States", "Remote"]
 
-indeed_jobs = []
-total_searches = len(SEARCH_TERMS) * len(LOCATIONS)
-current_search = 0
+# Searches run a few at a time; starts stay 2s apart as before, backing
+# off (up to 60s) while Indeed is failing and retrying failed searches
+INDEED_MAX_WORKERS = 4
+INDEED_SEARCH_INTERVAL = 2.0  # seconds between search starts
+INDEED_MAX_INTERVAL = 60.0
+INDEED_ATTEMPTS = 3
 
-print("\n[INDEED]")
+indeed_limiter = RateLimiter(INDEED_SEARCH_INTERVAL, INDEED_MAX_INTERVAL)
 
-for location in LOCATIONS:
-    for term in SEARCH_TERMS:
-        current_search += 1
-        print(f"  [{current_search}/{total_searches}] {term} - {location}")
-        
+
+def search_indeed(term, location):
+    """Run a single JobSpy Indeed search, retrying on failure or no results"""
+    for attempt in range(1, INDEED_ATTEMPTS + 1):
+        indeed_limiter.wait()
         try:
             jobs = scrape_jobs(
                 site_name=["indeed"],
@@ -54,142 +98,212 @@ for location in LOCATIONS:
                 hours_old=168,  # 7 days
                 country_indeed="USA"
             )
+        except Exception:
+            indeed_limiter.record_failure()
+            if attempt == INDEED_ATTEMPTS:
+                raise
+        else:
+            # JobSpy logs a throttled (non-200) Indeed response and returns
+            # whatever it has instead of raising, so an empty result backs
+            # off and retries as well
+            if len(jobs) > 0:
+                indeed_limiter.record_success()
+                return jobs
+            indeed_limiter.record_failure()
+    return jobs
+
+
+indeed_jobs = []
+searches = [(term, location) for location in LOCATIONS for term in SEARCH_TERMS]
+
+logger.info("\n[INDEED]")
+
+with ThreadPoolExecutor(max_workers=INDEED_MAX_WORKERS) as executor:
+    futures = [executor.submit(search_indeed, term, location) for term, location in searches]
+    
+    # Report in submission order so the log reads the same as a serial run
+    for i, ((term, location), future) in enumerate(zip(searches, futures), 1):
+        logger.info("  [%d/%d] %s - %s", i, len(searches), term, location)
+        
+        try:
+            jobs = future.result()
             if len(jobs) > 0:
                 indeed_jobs.append(jobs)
-                print(f"    ✓ Found {len(jobs)} jobs")
-            time.sleep(2)
+                logger.info("    ✓ Found %d jobs", len(jobs))
         except Exception as e:
-            print(f"    ✗ Error: {str(e)[:50]}")
+            logger.info("    ✗ Error: %.50s", e)
 
 # Combine and dedupe Indeed results
 if indeed_jobs:
-    indeed_df = pd.concat(indeed_jobs, ignore_index=True)
-    indeed_df = indeed_df.drop_duplicates(subset=['job_url'])
-    print(f"\n  Total Indeed (deduped): {len(indeed_df)}")
+    indeed_df = pd.concat(indeed_jobs, ignore_index=True).drop_duplicates(
+        subset=['job_url'], ignore_index=True
+    )
+    logger.info("\n  Total Indeed (deduped): %d", len(indeed_df))
 else:
     indeed_df = pd.DataFrame()
-    print("\n  No Indeed jobs found")
+    logger.info("\n  No Indeed jobs found")
 
 
 # ============================================================
 # PART 2: FRACTIONALJOBS.IO (IMPROVED - Fetches full details)
 # ============================================================
 
-print("\n[FRACTIONALJOBS.IO]")
+logger.info("\n[FRACTIONALJOBS.IO]")
 
 HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
 }
 
 BASE_URL = "https://www.fractionaljobs.io"
+
+# Detail-page patterns, compiled once rather than per job page
+COMPANY_PATTERNS = [
+    re.compile(r'at\s+([A-Z][A-Za-z0-9\s&\-\.]+?)(?:\s+\||\s+–|\s+in\s+|$)'),
+    re.compile(r'Company:\s*([A-Za-z0-9\s&\-\.]+)'),
+]
+HOURS_PATTERN = re.compile(r'(\d+)\s*(?:hours?\s*(?:per\s*week|/\s*week|weekly)|hrs?/wk)', re.I)
+DESCRIPTION_CLASS_PATTERN = re.compile(r'description|content|body|job-details|prose', re.I)
+COMP_PATTERN = re.compile(r'\$[\d,]+(?:\s*-\s*\$[\d,]+)?(?:\s*(?:per|/)\s*(?:hour|hr|month|mo|year|yr|annual))?')
+
+# Detail pages are fetched a few at a time over one pooled session, with
+# request starts spaced out so the site sees a steady, polite rate
+FJ_MAX_WORKERS = 4
+FJ_REQUEST_INTERVAL = 1.0  # seconds between request starts (see README rate limits)
+FJ_MAX_INTERVAL = 30.0     # cap for the backoff after 429s
+FJ_ATTEMPTS = 3
+
+session = requests.Session()
+session.headers.update(HEADERS)
+# Retry dropped connections and transient 5xx responses with backoff.
+# 429s are left to fetch_job_details so the retry waits on fj_limiter;
+# urllib3 would otherwise retry any 429 that carries Retry-After itself.
+session.mount('https://', HTTPAdapter(max_retries=Retry(
+    total=3, backoff_factor=0.5, status_forcelist=(500, 502, 503, 504),
+    respect_retry_after_header=False,
+)))
+fj_limiter = RateLimiter(FJ_REQUEST_INTERVAL, FJ_MAX_INTERVAL)
+
+
+def fetch_job_details(job_url):
+    """Fetch a single FractionalJobs.io listing and extract its fields"""
+    for attempt in range(1, FJ_ATTEMPTS + 1):
+        fj_limiter.wait()
+        job_response = session.get(job_url, timeout=30)
+        if job_response.status_code == 429:
+            fj_limiter.record_failure()
+            if attempt == FJ_ATTEMPTS:
+                job_response.raise_for_status()
+        else:
+            fj_limiter.record_success()
+            break
+    
+    job_soup = BeautifulSoup(job_response.content, 'lxml')
+    
+    job_data = {
+        'title': None,
+        'company': None,
+        'location': 'Remote',
+        'hours_per_week': None,
+        'compensation': None,
+        'description': None,
+        'job_url': job_url,
+        'source': 'fractionaljobs'
+    }
+    
+    # Extract title (usually in h1)
+    h1 = job_soup.find('h1')
+    if h1:
+        job_data['title'] = h1.get_text(strip=True)
+    
+    # Try to extract from page text
+    page_text = job_soup.get_text(separator=' ', strip=True)
+    
+    # Extract company - look for patterns or specific elements
+    # FractionalJobs often has company name near the title or in specific divs
+    for pattern in COMPANY_PATTERNS:
+        match = pattern.search(page_text)
+        if match:
+            job_data['company'] = match.group(1).strip()[:100]
+            break
+    
+    # If no company found, try to extract from URL
+    if not job_data['company']:
+        url_parts = job_url.split('/')[-1].split('-at-')
+        if len(url_parts) > 1:
+            job_data['company'] = url_parts[-1].replace('-', ' ').title()
+    
+    # Extract hours per week
+    hours_match = HOURS_PATTERN.search(page_text)
+    if hours_match:
+        job_data['hours_per_week'] = hours_match.group(1)
+    
+    # Extract compensation
+    comp_match = COMP_PATTERN.search(page_text)
+    if comp_match:
+        job_data['compensation'] = comp_match.group(0)
+    
+    # Extract description (look for main content area)
+    desc_elem = job_soup.find('div', class_=DESCRIPTION_CLASS_PATTERN)
+    if desc_elem:
+        job_data['description'] = desc_elem.get_text(separator='\n', strip=True)[:5000]
+    else:
+        # Fallback: get main article or body content
+        main = job_soup.find('main') or job_soup.find('article')
+        if main:
+            job_data['description'] = main.get_text(separator='\n', strip=True)[:5000]
+    
+    # bs4 trees are full of parent/sibling cycles; free this one now rather than at the next GC
+    job_soup.decompose()
+    
+    return job_data
+
+
 fj_jobs = []
 
 try:
     # Step 1: Get all job listing URLs from the index page
-    print("  Fetching job index...")
-    response = requests.get(f"{BASE_URL}/jobs", headers=HEADERS, timeout=30)
-    soup = BeautifulSoup(response.text, 'html.parser')
+    logger.info("  Fetching job index...")
+    response = session.get(f"{BASE_URL}/jobs", timeout=30)
+    # Only the links matter on the index page, so skip building the rest of the tree
+    soup = BeautifulSoup(response.content, 'lxml', parse_only=SoupStrainer('a', href=True))
     
     job_urls = []
+    seen_urls = set()
     for link in soup.find_all('a', href=True):
         href = link['href']
         if '/jobs/' in href and href != '/jobs' and 'fractionaljobs.io/jobs/' not in href:
             full_url = f"{BASE_URL}{href}" if href.startswith('/') else href
-            if full_url not in job_urls:
+            if full_url not in seen_urls:
+                seen_urls.add(full_url)
                 job_urls.append(full_url)
+    soup.decompose()
     
-    print(f"  Found {len(job_urls)} job listing URLs")
+    logger.info("  Found %d job listing URLs", len(job_urls))
     
-    # Step 2: Fetch full details from each job page
-    for i, job_url in enumerate(job_urls, 1):
-        print(f"  [{i}/{len(job_urls)}] Fetching: {job_url.split('/')[-1][:40]}...")
+    # Step 2: Fetch full details from each job page (results kept in index order)
+    with ThreadPoolExecutor(max_workers=FJ_MAX_WORKERS) as executor:
+        futures = [executor.submit(fetch_job_details, job_url) for job_url in job_urls]
         
-        try:
-            job_response = requests.get(job_url, headers=HEADERS, timeout=30)
-            job_soup = BeautifulSoup(job_response.text, 'html.parser')
-            
-            job_data = {
-                'title': None,
-                'company': None,
-                'location': 'Remote',
-                'hours_per_week': None,
-                'compensation': None,
-                'description': None,
-                'job_url': job_url,
-                'source': 'fractionaljobs'
-            }
-            
-            # Extract title (usually in h1)
-            h1 = job_soup.find('h1')
-            if h1:
-                job_data['title'] = h1.get_text(strip=True)
-            
-            # Try to extract from page text
-            page_text = job_soup.get_text(separator=' ', strip=True)
-            
-            # Extract company - look for patterns or specific elements
-            # FractionalJobs often has company name near the title or in specific divs
-            company_patterns = [
-                r'at\s+([A-Z][A-Za-z0-9\s&\-\.]+?)(?:\s+\||\s+–|\s+in\s+|$)',
-                r'Company:\s*([A-Za-z0-9\s&\-\.]+)',
-            ]
-            for pattern in company_patterns:
-                match = re.search(pattern, page_text)
-                if match:
-                    job_data['company'] = match.group(1).strip()[:100]
-                    break
-            
-            # If no company found, try to extract from URL
-            if not job_data['company']:
-                url_parts = job_url.split('/')[-1].split('-at-')
-                if len(url_parts) > 1:
-                    job_data['company'] = url_parts[-1].replace('-', ' ').title()
+        for i, (job_url, future) in enumerate(zip(job_urls, futures), 1):
+            logger.info("  [%d/%d] Fetching: %.40s...", i, len(job_urls), job_url.split('/')[-1])
             
-            # Extract hours per week
-            hours_match = re.search(r'(\d+)\s*(?:hours?\s*(?:per\s*week|/\s*week|weekly)|hrs?/wk)', page_text, re.I)
-            if hours_match:
-                job_data['hours_per_week'] = hours_match.group(1)
-            
-            # Extract compensation
-            comp_patterns = [
-                r'\$[\d,]+(?:\s*-\s*\$[\d,]+)?(?:\s*(?:per|/)\s*(?:hour|hr|month|mo|year|yr|annual))?',
-                r'\$[\d,]+[kK]?\s*(?:-\s*\$[\d,]+[kK]?)?',
-            ]
-            for pattern in comp_patterns:
-                comp_match = re.search(pattern, page_text)
-                if comp_match:
-                    job_data['compensation'] = comp_match.group(0)
-                    break
-            
-            # Extract description (look for main content area)
-            desc_elem = job_soup.find('div', class_=lambda x: x and any(
-                cls in str(x).lower() for cls in ['description', 'content', 'body', 'job-details', 'prose']
-            ))
-            if desc_elem:
-                job_data['description'] = desc_elem.get_text(separator='\n', strip=True)[:5000]
-            else:
-                # Fallback: get main article or body content
-                main = job_soup.find('main') or job_soup.find('article')
-                if main:
-                    job_data['description'] = main.get_text(separator='\n', strip=True)[:5000]
-            
-            # Only add if we got at least a title or company
-            if job_data['title'] or job_data['company']:
-                fj_jobs.append(job_data)
-                status = f"✓ {job_data.get('title', 'No title')[:30]}"
-            else:
-                status = "✗ Could not extract data"
-            
-            print(f"      {status}")
-            time.sleep(1)  # Be polite
-            
-        except Exception as e:
-            print(f"      ✗ Error: {str(e)[:50]}")
+            try:
+                job_data = future.result()
+                
+                # Only add if we got at least a title or company
+                if job_data['title'] or job_data['company']:
+                    fj_jobs.append(job_data)
+                    logger.info("      ✓ %.30s", job_data['title'] or 'No title')
+                else:
+                    logger.info("      ✗ Could not extract data")
+                
+            except Exception as e:
+                logger.info("      ✗ Error: %.50s", e)
     
-    print(f"\n  Total FractionalJobs.io: {len(fj_jobs)}")
+    logger.info("\n  Total FractionalJobs.io: %d", len(fj_jobs))
     
 except Exception as e:
-    print(f"  ✗ Error fetching index: {str(e)}")
+    logger.info("  ✗ Error fetching index: %s", e)
 
 fj_df = pd.DataFrame(fj_jobs) if fj_jobs else pd.DataFrame()
 
@@ -198,9 +312,9 @@ fj_df = pd.DataFrame(fj_jobs) if fj_jobs else pd.DataFrame()
 # SAVE RESULTS
 # ============================================================
 
-print("\n" + "=" * 60)
-print("RESULTS")
-print("=" * 60)
+logger.info("\n" + "=" * 60)
+logger.info("RESULTS")
+logger.info("=" * 60)
 
 timestamp = datetime.now().strftime('%Y%m%d_%H%M')
 
@@ -208,25 +322,25 @@ timestamp = datetime.now().strftime('%Y%m%d_%H%M')
 if not indeed_df.empty:
     indeed_file = f"indeed_fractional_{timestamp}.csv"
     indeed_df.to_csv(indeed_file, index=False)
-    print(f"Indeed: {len(indeed_df)} jobs → {indeed_file}")
+    logger.info("Indeed: %d jobs → %s", len(indeed_df), indeed_file)
 else:
-    print("Indeed: No jobs found")
+    logger.info("Indeed: No jobs found")
 
 # Save FractionalJobs.io jobs
 if not fj_df.empty:
     fj_file = f"fractionaljobs_{timestamp}.csv"
     fj_df.to_csv(fj_file, index=False)
-    print(f"FractionalJobs.io: {len(fj_df)} jobs → {fj_file}")
+    logger.info("FractionalJobs.io: %d jobs → %s", len(fj_df), fj_file)
     
     # Quick quality check
     with_title = fj_df['title'].notna().sum()
     with_comp = fj_df['compensation'].notna().sum()
-    print(f"  - With titles: {with_title}/{len(fj_df)} ({with_title/len(fj_df)*100:.0f}%)")
-    print(f"  - With compensation: {with_comp}/{len(fj_df)} ({with_comp/len(fj_df)*100:.0f}%)")
+    logger.info("  - With titles: %d/%d (%.0f%%)", with_title, len(fj_df), with_title / len(fj_df) * 100)
+    logger.info("  - With compensation: %d/%d (%.0f%%)", with_comp, len(fj_df), with_comp / len(fj_df) * 100)
 else:
-    print("FractionalJobs.io: No jobs found")
+    logger.info("FractionalJobs.io: No jobs found")
 
 # Combined count
 total = len(indeed_df) + len(fj_df)
-print(f"\nTotal: {total} jobs")
-print("=" * 60)
+logger.info("\nTotal: %d jobs", total)
+logger.info("=" * 60)